@@ -1,11 +1,14 @@
 import sys
+import csv
+import json
 import sqlite3
 import requests
 import threading
 from concurrent.futures import ThreadPoolExecutor
-from PyQt5.QtCore import QTimer, pyqtSignal, QObject
-from PyQt5.QtWidgets import QApplication, QMainWindow, QTableView, QLineEdit, QPushButton, QVBoxLayout, QWidget, QHBoxLayout, QFormLayout, QDialog, QDialogButtonBox, QMessageBox, QProgressBar, QStatusBar
-from PyQt5.QtSql import QSqlDatabase, QSqlTableModel
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QObject
+from PyQt5.QtWidgets import QApplication, QMainWindow, QTableView, QLineEdit, QPushButton, QVBoxLayout, QWidget, QHBoxLayout, QFormLayout, QDialog, QDialogButtonBox, QMessageBox, QProgressBar, QStatusBar, QListWidget, QListWidgetItem, QLabel, QFileDialog
+from PyQt5.QtSql import QSqlDatabase, QSqlTableModel, QSqlQuery
+from user_facets import USER_FACETS_SCHEMA, USER_FACETS_BACKFILL, USER_FACETS_TABLE_QUERY
 
 # Подключение к базе данных SQLite
 def connect_db():
@@ -18,8 +21,42 @@ def connect_db():
     if not db.open():
         print("Cannot establish a database connection")  # Выводим ошибку в случае сбоя
         return False
+    return ensure_user_facets(db)
+
+def ensure_user_facets(db):
+    """
+    Создает индекс по user_id, сводную таблицу user_post_counts и триггеры,
+    поддерживающие ее при вставке и удалении постов.
+    Для уже существующей базы сводная таблица заполняется один раз.
+    """
+    query = QSqlQuery(db)
+    query.exec(USER_FACETS_TABLE_QUERY)
+    # Сводной таблицы еще нет или она создана прежней версией - (пере)создадим и заполним ее
+    needs_backfill = not query.next() or "WITHOUT ROWID" not in query.value(0).upper()
+    query.finish()
+
+    statements = USER_FACETS_SCHEMA
+    if needs_backfill:
+        statements = ["DROP TABLE IF EXISTS user_post_counts"] + USER_FACETS_SCHEMA + USER_FACETS_BACKFILL
+
+    db.transaction()
+    for statement in statements:
+        if not query.exec(statement):
+            print(f"Cannot create user facets: {query.lastError().text()}")
+            db.rollback()
+            return False
+    db.commit()
     return True
 
+def sql_literal(value):
+    """
+    Формирует SQL-литерал для значения user_id: число подставляется как есть,
+    текст (его позволяет ввести редактируемая таблица) - в кавычках.
+    """
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    return str(value)
+
 # Сигнальный класс для обновления GUI
 class SignalManager(QObject):
     """
@@ -28,10 +65,32 @@ class SignalManager(QObject):
     """
     data_loaded = pyqtSignal()  # Сигнал для обновления данных
     progress_updated = pyqtSignal(int)  # Сигнал для обновления прогресса
+    export_progress_updated = pyqtSignal(int)  # Сигнал для обновления прогресса экспорта
+    export_finished = pyqtSignal(str)  # Сигнал о завершении экспорта (текст сообщения)
 
 # Создаем объект сигналов
 signal_manager = SignalManager()
 
+# Форматы экспорта: фильтр диалога сохранения -> (формат, расширение файла)
+EXPORT_FORMATS = {
+    "CSV Files (*.csv)": ("csv", ".csv"),
+    "NDJSON Files (*.ndjson)": ("ndjson", ".ndjson"),
+    "Parquet Files (*.parquet)": ("parquet", ".parquet"),
+}
+EXPORT_CHUNK_SIZE = 10000  # Количество строк, читаемых из курсора за один раз
+
+def export_format_for(file_path, selected_filter):
+    """
+    Определяет формат экспорта по выбранному фильтру диалога,
+    а если фильтр не передан - по расширению файла (по умолчанию CSV).
+    """
+    if selected_filter in EXPORT_FORMATS:
+        return EXPORT_FORMATS[selected_filter]
+    for export_format, extension in EXPORT_FORMATS.values():
+        if file_path.lower().endswith(extension):
+            return export_format, extension
+    return EXPORT_FORMATS["CSV Files (*.csv)"]
+
 # Основное окно приложения
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -63,6 +122,13 @@ class MainWindow(QMainWindow):
         self.load_button = QPushButton("Load Data")
         self.load_button.clicked.connect(self.load_data_from_server)  # Загрузка данных с сервера
 
+        self.export_button = QPushButton("Export")
+        self.export_button.clicked.connect(self.export_data)  # Экспорт отфильтрованных данных
+
+        # Отдельный прогресс-бар экспорта, чтобы его не перезаписывала загрузка с сервера
+        self.export_progress_bar = QProgressBar()
+        self.export_progress_bar.setValue(0)
+
         # Создаем прогресс-бар
         self.progress_bar = QProgressBar()
         self.progress_bar.setValue(0)  # Начальное значение прогресса
@@ -78,6 +144,17 @@ class MainWindow(QMainWindow):
         self.model.select()  # Загружаем данные
         self.table_view.setModel(self.model)  # Привязываем модель к таблице
 
+        # Создаем панель фасетов: количество постов по каждому пользователю
+        self.selected_user_id = None  # Выбранный пользователь (None - все пользователи)
+        self.user_facets = QListWidget()
+        self.user_facets.setMaximumWidth(200)
+        self.user_facets.itemClicked.connect(self.select_user)  # Фильтрация по выбранному пользователю
+        self.load_user_facets()
+
+        facet_layout = QVBoxLayout()
+        facet_layout.addWidget(QLabel("Users"))
+        facet_layout.addWidget(self.user_facets)
+
         # Компонуем элементы интерфейса
         layout = QVBoxLayout()
         layout.addWidget(self.search_field)
@@ -93,14 +170,27 @@ class MainWindow(QMainWindow):
 
         layout.addLayout(button_layout)
 
+        # Кнопка экспорта и его прогресс-бар
+        export_layout = QHBoxLayout()
+        export_layout.addWidget(self.export_button)
+        export_layout.addWidget(self.export_progress_bar)
+        layout.addLayout(export_layout)
+
+        # Панель фасетов слева, таблица и кнопки справа
+        main_layout = QHBoxLayout()
+        main_layout.addLayout(facet_layout)
+        main_layout.addLayout(layout)
+
         # Устанавливаем общий контейнер для интерфейса
         container = QWidget()
-        container.setLayout(layout)
+        container.setLayout(main_layout)
         self.setCentralWidget(container)
 
         # Соединяем сигналы с функциями обновления
         signal_manager.data_loaded.connect(self.load_data)  # Сигнал для обновления данных
         signal_manager.progress_updated.connect(self.update_progress_bar)  # Сигнал для обновления прогресса
+        signal_manager.export_progress_updated.connect(self.export_progress_bar.setValue)  # Сигнал для обновления прогресса экспорта
+        signal_manager.export_finished.connect(self.on_export_finished)  # Сигнал о завершении экспорта
 
         # Создаем таймер для периодического обновления данных
         self.timer = QTimer()
@@ -113,6 +203,8 @@ class MainWindow(QMainWindow):
         """
         search_text = self.search_field.text()  # Получаем текст из поля поиска
         filter_text = f"title LIKE '%{search_text}%'"  # Формируем SQL-фильтр
+        if self.selected_user_id is not None:
+            filter_text += f" AND user_id = {sql_literal(self.selected_user_id)}"  # Поиск по индексу idx_posts_user_id
         self.model.setFilter(filter_text)  # Устанавливаем фильтр для модели
         self.model.select()  # Применяем изменения
 
@@ -121,6 +213,40 @@ class MainWindow(QMainWindow):
         Перезагружает данные из базы в таблицу.
         """
         self.model.select()
+        self.load_user_facets()
+
+    def load_user_facets(self):
+        """
+        Заполняет панель фасетов из сводной таблицы user_post_counts
+        без сканирования таблицы posts.
+        """
+        self.user_facets.clear()
+        all_item = QListWidgetItem("All users")
+        all_item.setData(Qt.UserRole, None)
+        self.user_facets.addItem(all_item)
+
+        query = QSqlQuery("SELECT user_id, post_count FROM user_post_counts ORDER BY user_id")
+        while query.next():
+            user_id = query.value(0)
+            item = QListWidgetItem(f"User {user_id} ({query.value(1)})")
+            item.setData(Qt.UserRole, user_id)
+            self.user_facets.addItem(item)
+            if user_id == self.selected_user_id:
+                self.user_facets.setCurrentItem(item)
+
+        if self.user_facets.currentItem() is None:
+            self.user_facets.setCurrentItem(all_item)
+            if self.selected_user_id is not None:
+                # У выбранного пользователя не осталось постов - сбрасываем фильтр
+                self.selected_user_id = None
+                self.search()
+
+    def select_user(self, item):
+        """
+        Фильтрует таблицу по пользователю, выбранному на панели фасетов.
+        """
+        self.selected_user_id = item.data(Qt.UserRole)
+        self.search()
 
     def open_add_dialog(self):
         """
@@ -198,6 +324,98 @@ class MainWindow(QMainWindow):
         """
         self.progress_bar.setValue(value)
 
+    def export_data(self):
+        """
+        Экспортирует записи, отобранные текущим фильтром, в файл в фоновом потоке.
+        """
+        file_path, selected_filter = QFileDialog.getSaveFileName(self, "Export Data", "", ";;".join(EXPORT_FORMATS))
+        if not file_path:
+            return
+
+        export_format, extension = export_format_for(file_path, selected_filter)
+        if not file_path.lower().endswith(extension):
+            file_path += extension
+
+        self.export_button.setEnabled(False)  # Не допускаем параллельный экспорт
+        self.export_progress_bar.setValue(0)
+        self.status_bar.showMessage(f"Exporting to {file_path}...")
+        threading.Thread(target=self.export_rows, args=(file_path, export_format, self.model.filter()), daemon=True).start()
+
+    def export_rows(self, file_path, export_format, filter_text):
+        """
+        Читает записи из базы порциями по EXPORT_CHUNK_SIZE и записывает их в файл,
+        не загружая весь результат в память.
+        """
+        where = f" WHERE {filter_text}" if filter_text else ""
+        db = sqlite3.connect("posts.db")  # Отдельное соединение для фонового потока
+        try:
+            # Редактируемая модель позволяет сохранить в user_id текст - тогда столбец экспортируется как текст
+            total, text_user_ids = db.execute(
+                f"SELECT COUNT(*), COALESCE(MAX(typeof(user_id) NOT IN ('integer', 'null')), 0) FROM posts{where}"
+            ).fetchone()
+            columns = [("id", "integer"), ("user_id", "text" if text_user_ids else "integer"), ("title", "text"), ("body", "text")]
+            cursor = db.execute(f"SELECT id, user_id, title, body FROM posts{where} ORDER BY id")
+
+            writer = EXPORT_WRITERS[export_format]
+            exported = 0
+            for rows in writer(file_path, columns, iter(lambda: cursor.fetchmany(EXPORT_CHUNK_SIZE), [])):
+                exported += rows
+                signal_manager.export_progress_updated.emit(int(exported / total * 100) if total else 100)
+
+            signal_manager.export_finished.emit(f"Exported {exported} records to {file_path}")
+        except Exception as e:
+            signal_manager.export_finished.emit(f"Export failed: {e}")
+        finally:
+            db.close()
+
+    def on_export_finished(self, message):
+        """
+        Сообщает пользователю о результате экспорта.
+        """
+        self.export_button.setEnabled(True)
+        self.export_progress_bar.setValue(100)
+        self.status_bar.showMessage(message, 10000)
+
+# Функции записи порций строк в файл; columns - список пар (имя, тип "integer"/"text").
+# Каждая функция возвращает количество записанных строк после каждой порции
+def write_csv(file_path, columns, chunks):
+    with open(file_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(name for name, _ in columns)
+        for chunk in chunks:
+            writer.writerows(chunk)
+            yield len(chunk)
+
+def write_ndjson(file_path, columns, chunks):
+    with open(file_path, "w", encoding="utf-8") as f:
+        for chunk in chunks:
+            names = [name for name, _ in columns]
+            f.writelines(json.dumps(dict(zip(names, row)), ensure_ascii=False) + "\n" for row in chunk)
+            yield len(chunk)
+
+def write_parquet(file_path, columns, chunks):
+    import pyarrow as pa  # Необязательная зависимость, нужна только для Parquet
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([(name, pa.int64() if column_type == "integer" else pa.string()) for name, column_type in columns])
+    with pq.ParquetWriter(file_path, schema) as writer:
+        for chunk in chunks:
+            arrays = []
+            for field, values in zip(schema, zip(*chunk)):
+                if field.type == pa.string():
+                    # SQLite не проверяет типы значений, поэтому приводим их к тексту
+                    values = [None if value is None else str(value) for value in values]
+                arrays.append(pa.array(values, type=field.type))
+            # Каждая порция записывается отдельной группой строк
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            yield len(chunk)
+
+EXPORT_WRITERS = {
+    "csv": write_csv,
+    "ndjson": write_ndjson,
+    "parquet": write_parquet,
+}
+
 # Диалог для добавления записи
 class AddRecordDialog(QDialog):
     def __init__(self, parent=None):
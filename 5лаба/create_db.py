@@ -1,5 +1,6 @@
 import sqlite3
 import requests
+from user_facets import USER_FACETS_SCHEMA, USER_FACETS_BACKFILL
 
 # Подключаемся к базе данных (если файла с базой нет, он будет создан)
 conn = sqlite3.connect('posts.db')
@@ -15,6 +16,13 @@ CREATE TABLE IF NOT EXISTS posts (
 )
 ''')
 
+# Индекс по автору, сводная таблица с количеством постов по пользователям и поддерживающие ее триггеры.
+# Таблица пересоздается и пересчитывается по уже имеющимся постам: INSERT OR IGNORE ниже
+# пропускает существующие записи, и триггеры для них не срабатывают
+cursor.execute('DROP TABLE IF EXISTS user_post_counts')
+for statement in USER_FACETS_SCHEMA + USER_FACETS_BACKFILL:
+    cursor.execute(statement)
+
 # Сохраняем изменения
 conn.commit()
 
@@ -0,0 +1,65 @@
+"""
+Схема панели фасетов: индекс по автору, сводная таблица количества постов
+по пользователям и поддерживающие ее триггеры.
+Используется и приложением (app.py), и скриптом создания базы (create_db.py).
+"""
+
+# SQL для индекса по автору и сводной таблицы количества постов по пользователям.
+# Триггеры пересоздаются при каждом запуске, чтобы база получала их актуальную версию;
+# посты без user_id в сводную таблицу не попадают.
+# Ключ user_id объявлен без типа в таблице WITHOUT ROWID: так он не становится псевдонимом rowid
+# и принимает те же значения, что и posts.user_id (в том числе текст, введенный через таблицу).
+USER_FACETS_SCHEMA = [
+    "CREATE INDEX IF NOT EXISTS idx_posts_user_id ON posts (user_id)",
+    """
+    CREATE TABLE IF NOT EXISTS user_post_counts (
+        user_id PRIMARY KEY,
+        post_count INTEGER NOT NULL
+    ) WITHOUT ROWID
+    """,
+    "DROP TRIGGER IF EXISTS trg_posts_insert_count",
+    """
+    CREATE TRIGGER trg_posts_insert_count AFTER INSERT ON posts
+    WHEN NEW.user_id IS NOT NULL
+    BEGIN
+        INSERT OR IGNORE INTO user_post_counts (user_id, post_count) VALUES (NEW.user_id, 0);
+        UPDATE user_post_counts SET post_count = post_count + 1 WHERE user_id = NEW.user_id;
+    END
+    """,
+    "DROP TRIGGER IF EXISTS trg_posts_delete_count",
+    """
+    CREATE TRIGGER trg_posts_delete_count AFTER DELETE ON posts
+    WHEN OLD.user_id IS NOT NULL
+    BEGIN
+        UPDATE user_post_counts SET post_count = post_count - 1 WHERE user_id = OLD.user_id;
+        DELETE FROM user_post_counts WHERE user_id = OLD.user_id AND post_count <= 0;
+    END
+    """,
+    "DROP TRIGGER IF EXISTS trg_posts_update_count",
+    """
+    CREATE TRIGGER trg_posts_update_count AFTER UPDATE OF user_id ON posts
+    WHEN OLD.user_id IS NOT NEW.user_id
+    BEGIN
+        UPDATE user_post_counts SET post_count = post_count - 1 WHERE user_id = OLD.user_id;
+        DELETE FROM user_post_counts WHERE user_id = OLD.user_id AND post_count <= 0;
+        INSERT OR IGNORE INTO user_post_counts (user_id, post_count)
+        SELECT NEW.user_id, 0 WHERE NEW.user_id IS NOT NULL;
+        UPDATE user_post_counts SET post_count = post_count + 1 WHERE user_id = NEW.user_id;
+    END
+    """,
+    # Пустые записи, оставленные прежними версиями триггеров для постов без user_id
+    "DELETE FROM user_post_counts WHERE post_count <= 0",
+]
+
+# Полный пересчет сводной таблицы по имеющимся постам (единственный проход по posts)
+USER_FACETS_BACKFILL = [
+    "DELETE FROM user_post_counts",
+    """
+    INSERT INTO user_post_counts (user_id, post_count)
+    SELECT user_id, COUNT(*) FROM posts WHERE user_id IS NOT NULL GROUP BY user_id
+    """,
+]
+
+# Запрос определения сводной таблицы; таблица без WITHOUT ROWID создана прежней версией
+# (с ключом INTEGER PRIMARY KEY) и должна быть пересоздана
+USER_FACETS_TABLE_QUERY = "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'user_post_counts'"
@@ -1,12 +1,505 @@
+import os
 import sys
+import glob
+import collections
+import hashlib  # Ключ кэша дискового хранилища по пути и версии файла
+import json
+import sqlite3  # Локальное дисковое хранилище для режима больших файлов
+import threading  # Фоновые потоки для импорта и экспорта данных
 import pandas as pd  # Библиотека для работы с табличными данными (CSV, DataFrame)
+from PyQt5.QtCore import QObject, pyqtSignal  # Сигналы для передачи событий из фонового потока
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QPushButton,
-    QLabel, QComboBox, QFileDialog, QWidget, QLineEdit, QTableWidget, QTableWidgetItem, QTextEdit
+    QLabel, QComboBox, QFileDialog, QWidget, QLineEdit, QTableWidget, QTableWidgetItem, QTextEdit,
+    QProgressBar, QCheckBox
 )  # Модули PyQt5 для создания интерфейса
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure  # Модули Matplotlib для построения графиков
 
+# Форматы экспорта: фильтр диалога сохранения -> (формат, расширение файла)
+EXPORT_FORMATS = {
+    "CSV Files (*.csv)": ("csv", ".csv"),
+    "NDJSON Files (*.ndjson)": ("ndjson", ".ndjson"),
+    "Parquet Files (*.parquet)": ("parquet", ".parquet"),
+}
+EXPORT_CHUNK_SIZE = 50000  # Количество строк DataFrame, записываемых за один раз
+
+# Параметры режима больших файлов (данные хранятся на диске в SQLite)
+# Каталог дисковых хранилищ задается переменной окружения DATA_ANALYSIS_STORE_DIR.
+# По умолчанию используется кэш в домашнем каталоге: временный каталог часто размещается в памяти (tmpfs)
+STORE_DIR = os.environ.get("DATA_ANALYSIS_STORE_DIR") or os.path.join(
+    os.path.expanduser("~"), ".cache", "data_analysis_store"
+)
+IMPORT_CHUNK_SIZE = 100000  # Количество строк CSV, читаемых в память за один раз
+PAGE_SIZE = 500  # Количество строк на одной странице таблицы
+MAX_CHART_POINTS = 1000  # Максимальное количество точек на графике
+NUMERIC_COLUMNS = ['Value1', 'Value2']  # Столбцы, приводимые к числовому типу
+CATEGORY_COLUMN = 'Category'  # Столбец, по которому строится круговая диаграмма
+PIE_TOP_N = 10  # Количество категорий на круговой диаграмме, остальные объединяются в "Другие"
+OTHER_LABEL = "Другие"
+
+
+class TaskSignals(QObject):
+    """
+    Сигналы для передачи хода фоновых задач (импорт, экспорт) в интерфейс.
+    """
+    import_progress_updated = pyqtSignal(int)  # Процент выполнения импорта
+    export_progress_updated = pyqtSignal(int)  # Процент выполнения экспорта
+    export_finished = pyqtSignal(str)  # Текст сообщения о результате экспорта
+    import_finished = pyqtSignal(str)  # Текст ошибки импорта (пустая строка - успех)
+
+
+def clean_data(data):
+    """
+    Приводит типы столбцов и удаляет строки с некорректными или пропущенными значениями.
+    Применяется как ко всему DataFrame, так и к отдельным порциям при импорте на диск.
+    """
+    # Преобразуем столбец 'Date' в формат даты, если он существует
+    if 'Date' in data.columns:
+        data['Date'] = pd.to_datetime(data['Date'], errors='coerce')
+
+    # Преобразуем числовые столбцы, чтобы они имели тип float или int
+    for column in NUMERIC_COLUMNS:
+        if column in data.columns:
+            data[column] = pd.to_numeric(data[column], errors='coerce')
+
+    # Удаляем строки с некорректными или пропущенными значениями
+    return data.dropna()
+
+
+def merge_dtypes(dtypes, chunk):
+    """
+    Объединяет типы столбцов очередной порции с уже известными:
+    разные числовые типы расширяются до float64, прочие расхождения - до object.
+    """
+    for column, dtype in chunk.dtypes.items():
+        known = dtypes.setdefault(column, dtype)
+        if known != dtype:
+            numeric = known.kind in 'iuf' and dtype.kind in 'iuf'
+            dtypes[column] = pd.api.types.pandas_dtype('float64' if numeric else 'object')
+
+
+def top_categories(counts):
+    """
+    Оставляет PIE_TOP_N самых частых категорий, объединяя остальные в одну долю "Другие".
+    """
+    if len(counts) <= PIE_TOP_N:
+        return counts
+    other = pd.Series({OTHER_LABEL: counts.iloc[PIE_TOP_N:].sum()})
+    return pd.concat([counts.iloc[:PIE_TOP_N], other])
+
+
+def text_values(series):
+    """
+    Приводит значения столбца со смешанными типами к строкам, сохраняя пропуски.
+    """
+    return series.map(lambda value: None if pd.isna(value) else str(value)).astype(object)
+
+
+def quote(column):
+    """
+    Экранирует имя столбца для использования в SQL-запросе.
+    """
+    return '"' + column.replace('"', '""') + '"'
+
+
+class DiskDataStore:
+    """
+    Дисковое хранилище данных CSV файла в локальной базе SQLite.
+    Файл импортируется один раз порциями; при импорте же вычисляются статистика числовых столбцов,
+    количество строк по категориям и суммы по дням для графиков. Поэтому интерфейс читает
+    только эти небольшие сводки и отдельные страницы таблицы, а объем памяти не зависит от размера файла.
+    Строки, добавленные вручную, хранятся в отдельной таблице session_data и удаляются при закрытии,
+    чтобы кэш импорта всегда соответствовал содержимому файла.
+    """
+    # Количество открытых соединений с каждым файлом хранилища (основной поток и экспорт);
+    # такие файлы не удаляются при очистке устаревших хранилищ
+    live_connections = collections.Counter()
+
+    def __init__(self, csv_path):
+        # Хранилище привязано к пути, размеру и времени изменения файла: измененный файл импортируется заново
+        stat = os.stat(csv_path)
+        self.path_key = hashlib.md5(os.path.abspath(csv_path).encode()).hexdigest()
+        version_key = hashlib.md5(f"{stat.st_size}|{stat.st_mtime}".encode()).hexdigest()[:12]
+        self.csv_path = csv_path
+        self.db_path = os.path.join(STORE_DIR, f"{self.path_key}-{version_key}.sqlite")
+        self.conn = None  # Соединение основного потока, открывается после импорта
+        self.columns = []
+        self.numeric_columns = []
+        self.dtypes = {}  # Типы столбцов DataFrame, восстанавливаемые при чтении из базы
+        self.file_stats = {}  # Минимум, максимум, сумма и количество значений числовых столбцов файла
+        self.file_rows = 0  # Количество строк, импортированных из файла
+        self.rows = 0  # Общее количество строк вместе с добавленными вручную
+
+    def is_imported(self):
+        """
+        Проверяет, что файл уже был полностью импортирован в хранилище.
+        """
+        if not os.path.exists(self.db_path):
+            return False
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'store_info'").fetchone() is not None
+        finally:
+            conn.close()
+
+    def connect(self):
+        """
+        Открывает соединение с хранилищем в режиме WAL: чтение при экспорте
+        не блокирует запись строк сеанса в основном потоке, и наоборот.
+        """
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def remove_stale_stores(self):
+        """
+        Удаляет хранилища прежних версий этого файла и остатки прерванного импорта.
+        Хранилища с открытыми соединениями (и их файлы журнала) пропускаются
+        и удаляются при следующем импорте.
+        """
+        for path in glob.glob(os.path.join(STORE_DIR, f"{self.path_key}-*")):
+            db_path = path
+            for suffix in ("-wal", "-shm", "-journal"):
+                if path.endswith(suffix):
+                    db_path = path[:-len(suffix)]
+            if self.live_connections[db_path] > 0:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                pass  # Файл занят другим процессом - удалим его при следующем импорте
+
+    def import_csv(self, progress_callback):
+        """
+        Импортирует CSV файл в базу порциями по IMPORT_CHUNK_SIZE строк (выполняется в фоновом потоке)
+        и сохраняет сводки, по которым строятся статистика и графики.
+        Если файл уже был импортирован, повторный импорт не выполняется.
+        """
+        if self.is_imported():
+            return
+        os.makedirs(STORE_DIR, exist_ok=True)
+        self.remove_stale_stores()
+
+        dtypes = {}
+        stats = {}  # Столбец -> [минимум, максимум, сумма, количество]
+        daily = None  # Суммы и количества значений числовых столбцов по дням
+        rows = 0
+
+        conn = self.connect()
+        try:
+            # Количество строк по категориям для каждой порции; суммируется в базе после импорта,
+            # поэтому объем памяти не зависит от числа различных категорий
+            conn.execute("CREATE TABLE category_chunk_counts (value, value_count INTEGER)")
+            size = os.path.getsize(self.csv_path) or 1
+            with open(self.csv_path, "rb") as f:
+                for chunk in pd.read_csv(f, chunksize=IMPORT_CHUNK_SIZE):
+                    chunk = clean_data(chunk)
+                    merge_dtypes(dtypes, chunk)
+                    numeric = [c for c in chunk.columns if chunk[c].dtype.kind in 'iuf']
+
+                    for column in numeric:
+                        values = chunk[column]
+                        if values.empty:
+                            continue
+                        chunk_stats = [float(values.min()), float(values.max()), float(values.sum()), len(values)]
+                        known = stats.setdefault(column, chunk_stats)
+                        if known is not chunk_stats:
+                            known[:] = [min(known[0], chunk_stats[0]), max(known[1], chunk_stats[1]),
+                                        known[2] + chunk_stats[2], known[3] + chunk_stats[3]]
+
+                    if CATEGORY_COLUMN in chunk.columns:
+                        counts = chunk[CATEGORY_COLUMN].value_counts()
+                        conn.executemany("INSERT INTO category_chunk_counts VALUES (?, ?)",
+                                         [(str(value), int(count)) for value, count in counts.items()])
+
+                    if 'Date' in chunk.columns and numeric:
+                        days = chunk['Date'].dt.strftime('%Y-%m-%d')
+                        sums = chunk[numeric].groupby(days).agg(['sum', 'count'])
+                        daily = sums if daily is None else daily.add(sums, fill_value=0)
+
+                    chunk.to_sql("data", conn, if_exists="append", index=False)
+                    rows += len(chunk)
+                    progress_callback(min(int(f.tell() / size * 100), 100))
+
+            # Числовые столбцы определяются так же, как в обычном режиме (без логических)
+            numeric_columns = [c for c, dtype in dtypes.items() if dtype.kind in 'iuf']
+
+            conn.execute("CREATE TABLE category_counts (value PRIMARY KEY, value_count INTEGER) WITHOUT ROWID")
+            conn.execute("""
+                INSERT INTO category_counts
+                SELECT value, SUM(value_count) FROM category_chunk_counts GROUP BY value
+            """)
+            conn.execute("DROP TABLE category_chunk_counts")
+            # Индекс для выборки самых частых категорий без сортировки всей таблицы
+            conn.execute("CREATE INDEX idx_category_counts_count ON category_counts (value_count)")
+
+            conn.execute("CREATE TABLE date_rollup (day TEXT, name TEXT, value_sum REAL, value_count INTEGER)")
+            if daily is not None:
+                for column in numeric_columns:
+                    if column in daily.columns.get_level_values(0):
+                        conn.executemany(
+                            "INSERT INTO date_rollup VALUES (?, ?, ?, ?)",
+                            [(day, column, float(s), int(c))
+                             for day, s, c in zip(daily.index, daily[(column, 'sum')], daily[(column, 'count')])]
+                        )
+
+            # Таблица store_info создается последней и служит признаком завершенного импорта
+            conn.execute("CREATE TABLE store_info (csv_path TEXT, rows INTEGER, dtypes TEXT, numeric_stats TEXT)")
+            conn.execute("INSERT INTO store_info VALUES (?, ?, ?, ?)", (
+                self.csv_path, rows,
+                json.dumps({column: str(dtype) for column, dtype in dtypes.items()}),
+                json.dumps({column: stats[column] for column in numeric_columns if column in stats}),
+            ))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def open(self):
+        """
+        Открывает соединение основного потока, читает сводки импорта
+        и создает пустую таблицу для строк, добавляемых вручную.
+        """
+        self.conn = self.connect()
+        self.live_connections[self.db_path] += 1
+        rows, dtypes, numeric_stats = self.conn.execute(
+            "SELECT rows, dtypes, numeric_stats FROM store_info"
+        ).fetchone()
+        self.file_rows = self.rows = rows
+        self.dtypes = json.loads(dtypes)
+        self.columns = list(self.dtypes)
+        self.numeric_columns = [c for c in self.columns if pd.api.types.pandas_dtype(self.dtypes[c]).kind in 'iuf']
+        self.file_stats = json.loads(numeric_stats)
+        self.conn.execute("DROP TABLE IF EXISTS session_data")  # Остатки предыдущего сеанса
+        self.conn.execute("CREATE TABLE session_data AS SELECT * FROM data WHERE 0")
+        self.conn.commit()
+
+    def close(self):
+        """
+        Удаляет строки, добавленные вручную, и закрывает соединение основного потока.
+        """
+        if self.conn is not None:
+            try:
+                self.conn.execute("DROP TABLE IF EXISTS session_data")
+                self.conn.commit()
+            finally:
+                self.conn.close()
+                self.conn = None
+                self.live_connections[self.db_path] -= 1
+
+    def restore_types(self, frame):
+        """
+        Восстанавливает типы столбцов, прочитанных из базы (даты, логические значения и т.д.).
+        """
+        frame = frame.astype(self.dtypes)
+        # Столбец object может быть числовым в одних порциях и текстовым в других - приводим к тексту
+        for column, dtype in self.dtypes.items():
+            if dtype == 'object':
+                frame[column] = text_values(frame[column])
+        return frame
+
+    def numeric_stats(self):
+        """
+        Возвращает минимумы, максимумы и средние значения числовых столбцов:
+        сводка файла объединяется со статистикой строк, добавленных вручную.
+        """
+        if not self.numeric_columns:
+            return None
+        index = ["min", "max", "sum", "count"]
+        file_stats = pd.DataFrame(
+            {column: self.file_stats.get(column, [None, None, 0, 0]) for column in self.numeric_columns},
+            index=index, dtype=float
+        )
+        aggregates = ", ".join(
+            f"MIN({quote(c)}), MAX({quote(c)}), TOTAL({quote(c)}), COUNT({quote(c)})" for c in self.numeric_columns
+        )
+        values = self.conn.execute(f"SELECT {aggregates} FROM session_data").fetchone()
+        session_stats = pd.DataFrame([values[i::4] for i in range(4)], index=index,
+                                     columns=self.numeric_columns, dtype=float)
+        both = pd.concat([file_stats, session_stats])
+        return pd.DataFrame({
+            "min": both.loc["min"].min(),
+            "max": both.loc["max"].max(),
+            "mean": both.loc["sum"].sum() / both.loc["count"].sum(),
+        }).T
+
+    def page(self, page_number):
+        """
+        Возвращает одну страницу таблицы: строки файла выбираются по диапазону rowid,
+        после них следуют строки, добавленные вручную.
+        """
+        start, end = page_number * PAGE_SIZE, (page_number + 1) * PAGE_SIZE
+        frames = []
+        if start < self.file_rows:
+            frames.append(pd.read_sql_query(
+                "SELECT * FROM data WHERE rowid > ? AND rowid <= ? ORDER BY rowid",
+                self.conn, params=(start, min(end, self.file_rows))
+            ))
+        if end > self.file_rows:
+            frames.append(pd.read_sql_query(
+                "SELECT * FROM session_data WHERE rowid > ? AND rowid <= ? ORDER BY rowid",
+                self.conn, params=(max(start - self.file_rows, 0), end - self.file_rows)
+            ))
+        return self.restore_types(pd.concat(frames, ignore_index=True))
+
+    def date_series(self, column):
+        """
+        Возвращает ряд для графика по датам из сумм по дням,
+        сгруппированный не более чем в MAX_CHART_POINTS интервалов.
+        """
+        daily = pd.concat([
+            pd.read_sql_query(
+                "SELECT day, value_sum, value_count FROM date_rollup WHERE name = ?", self.conn, params=(column,)
+            ),
+            pd.read_sql_query(
+                f'SELECT date("Date") AS day, TOTAL({quote(column)}) AS value_sum, COUNT({quote(column)}) AS value_count '
+                f'FROM session_data GROUP BY 1', self.conn
+            ),
+        ]).groupby('day', as_index=False).sum()
+        if daily.empty:
+            return pd.DataFrame(columns=["Date", column])
+
+        daily['Date'] = pd.to_datetime(daily['day'])
+        offsets = (daily['Date'] - daily['Date'].min()).dt.days
+        span = offsets.max()
+        # Номер интервала от 0 до MAX_CHART_POINTS - 1 (последний день попадает в последний интервал)
+        daily['bucket'] = (offsets * MAX_CHART_POINTS // span).clip(upper=MAX_CHART_POINTS - 1) if span else 0
+        series = daily.groupby('bucket').agg(
+            Date=('Date', 'min'), value_sum=('value_sum', 'sum'), value_count=('value_count', 'sum')
+        )
+        series[column] = series['value_sum'] / series['value_count']
+        return series[['Date', column]].reset_index(drop=True)
+
+    def category_counts(self):
+        """
+        Возвращает количество строк для PIE_TOP_N самых частых значений столбца Category
+        и общее количество остальных строк под меткой "Другие".
+        Читаются только самые частые категории файла и категории строк сеанса.
+        """
+        session = pd.read_sql_query(
+            f"SELECT {quote(CATEGORY_COLUMN)} AS value, COUNT(*) AS value_count FROM session_data GROUP BY 1",
+            self.conn
+        )
+        session['value'] = session['value'].astype(str)
+        # Кандидаты: самые частые категории файла и все категории, встречающиеся в строках сеанса
+        candidates = pd.read_sql_query(
+            f"SELECT value, value_count FROM (SELECT * FROM category_counts ORDER BY value_count DESC LIMIT ?) "
+            f"UNION SELECT value, value_count FROM category_counts "
+            f"WHERE value IN (SELECT CAST({quote(CATEGORY_COLUMN)} AS TEXT) FROM session_data)",
+            self.conn, params=[PIE_TOP_N]
+        )
+        counts = pd.concat([candidates, session]).groupby('value')['value_count'].sum()
+        counts = counts.sort_values(ascending=False).iloc[:PIE_TOP_N]
+        other = self.rows - counts.sum()
+        if other > 0:
+            counts[OTHER_LABEL] = other
+        counts.index.name = CATEGORY_COLUMN
+        return counts
+
+    def append(self, new_row):
+        """
+        Приводит введенную строку к типам столбцов и добавляет ее в таблицу строк текущего сеанса.
+        """
+        new_row = new_row.copy()
+        for column, dtype in self.dtypes.items():
+            if dtype == 'bool':
+                # Логические значения вводятся текстом: True/False или 1/0
+                new_row[column] = new_row[column].astype(str).str.strip().str.lower().map(
+                    {'true': True, 'false': False, '1': True, '0': False}
+                )
+        new_row = clean_data(new_row)
+        if new_row.empty:
+            raise ValueError("Введены некорректные значения!")
+        new_row = self.restore_types(new_row)
+
+        new_row.to_sql("session_data", self.conn, if_exists="append", index=False)
+        self.conn.commit()
+        self.rows += len(new_row)
+
+    def iter_chunks(self):
+        """
+        Читает все данные порциями по EXPORT_CHUNK_SIZE строк через отдельное соединение
+        (используется для экспорта в фоновом потоке).
+        """
+        conn = self.connect()
+        self.live_connections[self.db_path] += 1
+        try:
+            # Обе таблицы читаются в одной транзакции - из одного снимка базы,
+            # даже если основной поток тем временем добавит строки или закроет хранилище
+            conn.execute("BEGIN")
+            for table in ("data", "session_data"):
+                for chunk in pd.read_sql_query(f"SELECT * FROM {table} ORDER BY rowid", conn, chunksize=EXPORT_CHUNK_SIZE):
+                    yield self.restore_types(chunk)
+        finally:
+            conn.close()
+            self.live_connections[self.db_path] -= 1
+
+
+def export_format_for(file_path, selected_filter):
+    """
+    Определяет формат экспорта по выбранному фильтру диалога,
+    а если фильтр не передан - по расширению файла (по умолчанию CSV).
+    """
+    if selected_filter in EXPORT_FORMATS:
+        return EXPORT_FORMATS[selected_filter]
+    for export_format, extension in EXPORT_FORMATS.values():
+        if file_path.lower().endswith(extension):
+            return export_format, extension
+    return EXPORT_FORMATS["CSV Files (*.csv)"]
+
+
+def write_csv(file_path, chunks, dtypes):
+    """
+    Записывает порции DataFrame в CSV файл, возвращая количество строк после каждой порции.
+    """
+    with open(file_path, "w", newline="", encoding="utf-8") as f:
+        for i, chunk in enumerate(chunks):
+            chunk.to_csv(f, header=(i == 0), index=False)  # Заголовок пишется только один раз
+            yield len(chunk)
+
+
+def write_ndjson(file_path, chunks, dtypes):
+    """
+    Записывает порции DataFrame в NDJSON файл (одна JSON-запись на строку).
+    """
+    with open(file_path, "w", encoding="utf-8") as f:
+        for chunk in chunks:
+            if not chunk.empty:
+                text = chunk.to_json(orient="records", lines=True, date_format="iso", force_ascii=False)
+                f.write(text if text.endswith("\n") else text + "\n")
+            yield len(chunk)
+
+
+def write_parquet(file_path, chunks, dtypes):
+    """
+    Записывает порции DataFrame в Parquet файл, каждая порция - отдельная группа строк.
+    Схема строится по типам столбцов всего набора данных, а не по первой порции:
+    столбцы object (в том числе со смешанными значениями) записываются как строки.
+    """
+    import pyarrow as pa  # Необязательная зависимость, нужна только для Parquet
+    import pyarrow.parquet as pq
+
+    dtypes = {column: pd.api.types.pandas_dtype(dtype) for column, dtype in dtypes.items()}
+    text_columns = [column for column, dtype in dtypes.items() if dtype.kind in 'OSU']
+    schema = pa.schema([
+        (column, pa.string() if column in text_columns else pa.from_numpy_dtype(dtype))
+        for column, dtype in dtypes.items()
+    ])
+    with pq.ParquetWriter(file_path, schema) as writer:
+        for chunk in chunks:
+            chunk = chunk.copy()
+            for column in text_columns:
+                chunk[column] = text_values(chunk[column])
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            yield len(chunk)
+
+
+EXPORT_WRITERS = {
+    "csv": write_csv,
+    "ndjson": write_ndjson,
+    "parquet": write_parquet,
+}
+
 
 class DataAnalysisApp(QMainWindow):
     """
@@ -32,6 +525,15 @@ class DataAnalysisApp(QMainWindow):
         self.load_button.clicked.connect(self.load_data)  # Привязываем метод load_data к нажатию кнопки
         self.layout.addWidget(self.load_button)  # Добавляем кнопку в общий макет
 
+        # Флажок режима больших файлов: данные импортируются на диск и не загружаются в память целиком
+        self.disk_mode_checkbox = QCheckBox("Режим больших файлов (данные на диске)")
+        self.layout.addWidget(self.disk_mode_checkbox)
+
+        # Прогресс-бар импорта на диск (у экспорта свой прогресс-бар, задачи могут идти одновременно)
+        self.import_progress_bar = QProgressBar()
+        self.import_progress_bar.setValue(0)
+        self.layout.addWidget(self.import_progress_bar)
+
         # Поле для отображения общей статистики (кол-во строк и столбцов)
         self.stats_label = QLabel("Здесь будет отображена статистика")  # Создаем текстовое поле
         self.layout.addWidget(self.stats_label)  # Добавляем его в макет
@@ -65,9 +567,44 @@ class DataAnalysisApp(QMainWindow):
         self.data_table = QTableWidget()  # Создаем таблицу
         self.layout.addWidget(self.data_table)  # Добавляем таблицу в макет
 
+        # Переключение страниц таблицы в режиме больших файлов
+        self.page_layout = QHBoxLayout()
+        self.prev_page_button = QPushButton("< Назад")
+        self.prev_page_button.clicked.connect(lambda: self.change_page(-1))
+        self.page_label = QLabel()
+        self.next_page_button = QPushButton("Вперед >")
+        self.next_page_button.clicked.connect(lambda: self.change_page(1))
+        self.page_layout.addWidget(self.prev_page_button)
+        self.page_layout.addWidget(self.page_label)
+        self.page_layout.addWidget(self.next_page_button)
+        self.layout.addLayout(self.page_layout)
+        self.set_paging_visible(False)  # В обычном режиме таблица показывается целиком
+
+        # Кнопка экспорта данных и индикатор его выполнения
+        self.export_layout = QHBoxLayout()  # Горизонтальный макет для кнопки и прогресс-бара
+        self.export_button = QPushButton("Экспортировать данные")  # Кнопка экспорта
+        self.export_button.clicked.connect(self.export_data)  # Привязываем метод экспорта
+        self.export_progress_bar = QProgressBar()  # Прогресс-бар экспорта
+        self.export_progress_bar.setValue(0)
+        self.export_layout.addWidget(self.export_button)
+        self.export_layout.addWidget(self.export_progress_bar)
+        self.layout.addLayout(self.export_layout)
+
+        # Сигналы фоновых задач
+        self.task_signals = TaskSignals()
+        self.task_signals.import_progress_updated.connect(self.import_progress_bar.setValue)
+        self.task_signals.export_progress_updated.connect(self.export_progress_bar.setValue)
+        self.task_signals.export_finished.connect(self.on_export_finished)
+        self.task_signals.import_finished.connect(self.on_import_finished)
+
         # Переменная для хранения данных в виде DataFrame (из библиотеки pandas)
         self.data = None  # Изначально данных нет
 
+        # Дисковое хранилище для режима больших файлов (вместо self.data) и текущая страница таблицы
+        self.store = None
+        self.pending_store = None  # Хранилище, импорт которого выполняется в фоне
+        self.page_number = 0
+
     def load_data(self):
         """
         Метод для загрузки данных из CSV файла.
@@ -76,21 +613,14 @@ class DataAnalysisApp(QMainWindow):
         # Открываем диалог для выбора файла, поддерживаются только файлы с расширением .csv
         file_path, _ = QFileDialog.getOpenFileName(self, "Выберите CSV файл", "", "CSV Files (*.csv)")
         if file_path:  # Проверяем, выбран ли файл
+            if self.disk_mode_checkbox.isChecked():
+                self.load_data_to_disk(file_path)  # Импорт на диск выполняется в фоновом потоке
+                return
             try:
-                self.data = pd.read_csv(file_path)  # Загружаем данные в DataFrame
-
-                # Преобразуем столбец 'Date' в формат даты, если он существует
-                if 'Date' in self.data.columns:
-                    self.data['Date'] = pd.to_datetime(self.data['Date'], errors='coerce')
-
-                # Преобразуем числовые столбцы, чтобы они имели тип float или int
-                numeric_columns = ['Value1', 'Value2']
-                for column in numeric_columns:
-                    if column in self.data.columns:
-                        self.data[column] = pd.to_numeric(self.data[column], errors='coerce')
-
-                # Удаляем строки с некорректными или пропущенными значениями
-                self.data = self.data.dropna()
+                # Загружаем данные в DataFrame и приводим типы столбцов
+                self.data = clean_data(pd.read_csv(file_path))
+                self.close_store()
+                self.set_paging_visible(False)
 
                 # Обновляем интерфейс: статистика, таблица, график
                 self.update_stats()
@@ -100,11 +630,120 @@ class DataAnalysisApp(QMainWindow):
                 # Если произошла ошибка, выводим её в поле статистики
                 self.stats_label.setText(f"Ошибка при загрузке данных: {e}")
 
+    def load_data_to_disk(self, file_path):
+        """
+        Запускает импорт CSV файла в дисковое хранилище в фоновом потоке.
+        """
+        try:
+            store = DiskDataStore(file_path)
+        except OSError as e:
+            self.stats_label.setText(f"Ошибка при загрузке данных: {e}")
+            return
+
+        self.pending_store = store
+        self.update_task_buttons()  # Не допускаем параллельный импорт
+        self.import_progress_bar.setValue(0)
+        self.stats_label.setText("Импорт данных на диск...")
+        threading.Thread(target=self.import_store, args=(store,), daemon=True).start()
+
+    def import_store(self, store):
+        """
+        Импортирует данные в хранилище (выполняется в фоновом потоке).
+        """
+        try:
+            store.import_csv(self.task_signals.import_progress_updated.emit)
+            self.task_signals.import_finished.emit("")
+        except Exception as e:
+            self.task_signals.import_finished.emit(str(e))
+
+    def on_import_finished(self, error):
+        """
+        Переключает приложение на импортированное хранилище и обновляет интерфейс.
+        """
+        self.import_progress_bar.setValue(100)
+        store, self.pending_store = self.pending_store, None
+        self.update_task_buttons()
+        if error:
+            self.stats_label.setText(f"Ошибка при загрузке данных: {error}")
+            return
+
+        # Прежнее хранилище закрывается первым: это может быть тот же файл базы,
+        # и его закрытие удаляет таблицу строк сеанса
+        try:
+            self.close_store()
+            store.open()
+        except sqlite3.Error as e:
+            self.stats_label.setText(f"Ошибка при загрузке данных: {e}")
+            return
+        self.store = store
+        self.data = None  # В режиме больших файлов данные в памяти не хранятся
+        self.page_number = 0
+        self.set_paging_visible(True)
+
+        # Обновляем интерфейс: статистика, таблица, график
+        self.update_stats()
+        self.update_table()
+        self.update_chart()
+
+    def close_store(self):
+        """
+        Закрывает текущее дисковое хранилище, если оно открыто.
+        Соединение закрывается и при ошибке удаления строк сеанса.
+        """
+        if self.store is not None:
+            store, self.store = self.store, None
+            store.close()
+
+    def update_task_buttons(self):
+        """
+        Блокирует загрузку во время импорта или экспорта, а добавление строк - во время экспорта:
+        экспорт читает текущее хранилище, которое загрузка закрывает, а добавление дополняет.
+        """
+        exporting = not self.export_button.isEnabled()
+        self.load_button.setEnabled(self.pending_store is None and not exporting)
+        self.add_data_button.setEnabled(not exporting)
+
+    def set_paging_visible(self, visible):
+        """
+        Показывает или скрывает переключатель страниц таблицы.
+        """
+        self.prev_page_button.setVisible(visible)
+        self.page_label.setVisible(visible)
+        self.next_page_button.setVisible(visible)
+
+    def change_page(self, step):
+        """
+        Переходит на соседнюю страницу таблицы в режиме больших файлов.
+        """
+        if self.store is None:
+            return
+        last_page = max((self.store.rows - 1) // PAGE_SIZE, 0)
+        self.page_number = min(max(self.page_number + step, 0), last_page)
+        self.update_table()
+
     def update_stats(self):
         """
         Обновляет основную и детальную статистику загруженных данных.
         """
-        if self.data is not None and not self.data.empty:  # Проверяем, что данные не пусты
+        if self.store is not None:  # Режим больших файлов: статистика вычисляется запросом к базе
+            try:
+                self.stats_label.setText(f"""
+                Количество строк: {self.store.rows}
+                Количество столбцов: {len(self.store.columns)}
+                """)
+                numeric_stats = self.store.numeric_stats()
+                if numeric_stats is not None:
+                    detailed_stats = f"""
+                    Минимальные значения:\n{numeric_stats.loc['min']}
+                    Максимальные значения:\n{numeric_stats.loc['max']}
+                    Средние значения:\n{numeric_stats.loc['mean']}
+                    """
+                    self.stats_text.setText(detailed_stats)
+                else:
+                    self.stats_text.setText("Нет числовых данных для расчета статистики.")
+            except Exception as e:
+                self.stats_label.setText(f"Ошибка при вычислении статистики: {e}")
+        elif self.data is not None and not self.data.empty:  # Проверяем, что данные не пусты
             try:
                 numeric_data = self.data.select_dtypes(include=['number'])  # Берем только числовые столбцы
 
@@ -135,21 +774,31 @@ class DataAnalysisApp(QMainWindow):
     def update_table(self):
         """
         Отображает данные в виде таблицы.
+        В режиме больших файлов отображается только текущая страница, прочитанная с диска.
         """
-        if self.data is not None:  # Если данные существуют
-            self.data_table.setRowCount(len(self.data))  # Устанавливаем количество строк
-            self.data_table.setColumnCount(len(self.data.columns))  # Устанавливаем количество столбцов
-            self.data_table.setHorizontalHeaderLabels(self.data.columns)  # Устанавливаем заголовки столбцов
+        if self.store is not None:
+            data = self.store.page(self.page_number)
+            last_page = max((self.store.rows - 1) // PAGE_SIZE, 0)
+            self.page_label.setText(f"Страница {self.page_number + 1} из {last_page + 1}")
+        else:
+            data = self.data
+
+        if data is not None:  # Если данные существуют
+            self.data_table.setRowCount(len(data))  # Устанавливаем количество строк
+            self.data_table.setColumnCount(len(data.columns))  # Устанавливаем количество столбцов
+            self.data_table.setHorizontalHeaderLabels(data.columns)  # Устанавливаем заголовки столбцов
             # Заполняем таблицу данными из DataFrame
-            for i in range(len(self.data)):
-                for j in range(len(self.data.columns)):
-                    self.data_table.setItem(i, j, QTableWidgetItem(str(self.data.iloc[i, j])))
+            for i in range(len(data)):
+                for j in range(len(data.columns)):
+                    self.data_table.setItem(i, j, QTableWidgetItem(str(data.iloc[i, j])))
 
     def update_chart(self):
         """
         Отображает график на основе данных и выбранного типа графика.
+        В режиме больших файлов ряды агрегируются в базе и содержат не более MAX_CHART_POINTS точек.
         """
-        if self.data is not None:
+        if self.data is not None or self.store is not None:
+            columns = self.store.columns if self.store is not None else self.data.columns
             chart_type = self.chart_type.currentText()  # Получаем выбранный тип графика
 
             # Очищаем предыдущий график
@@ -157,8 +806,9 @@ class DataAnalysisApp(QMainWindow):
             ax = self.canvas.figure.add_subplot(111)
 
             if chart_type == "Линейный график":
-                if 'Date' in self.data.columns and 'Value1' in self.data.columns:
-                    ax.plot(self.data['Date'], self.data['Value1'], label='Value1')
+                if 'Date' in columns and 'Value1' in columns:
+                    series = self.store.date_series('Value1') if self.store is not None else self.data
+                    ax.plot(series['Date'], series['Value1'], label='Value1')
                     ax.set_title("Линейный график")
                     ax.set_xlabel("Date")
                     ax.set_ylabel("Value1")
@@ -166,8 +816,9 @@ class DataAnalysisApp(QMainWindow):
                     ax.text(0.5, 0.5, "Отсутствуют нужные данные", ha='center')
 
             elif chart_type == "Гистограмма":
-                if 'Date' in self.data.columns and 'Value2' in self.data.columns:
-                    ax.bar(self.data['Date'], self.data['Value2'], label='Value2')
+                if 'Date' in columns and 'Value2' in columns:
+                    series = self.store.date_series('Value2') if self.store is not None else self.data
+                    ax.bar(series['Date'], series['Value2'], label='Value2')
                     ax.set_title("Гистограмма")
                     ax.set_xlabel("Date")
                     ax.set_ylabel("Value2")
@@ -175,8 +826,12 @@ class DataAnalysisApp(QMainWindow):
                     ax.text(0.5, 0.5, "Отсутствуют нужные данные", ha='center')
 
             elif chart_type == "Круговая диаграмма":
-                if 'Category' in self.data.columns:
-                    self.data['Category'].value_counts().plot.pie(ax=ax, autopct='%1.1f%%')
+                if 'Category' in columns:
+                    if self.store is not None:
+                        counts = self.store.category_counts()
+                    else:
+                        counts = top_categories(self.data['Category'].value_counts())
+                    counts.plot.pie(ax=ax, autopct='%1.1f%%')
                     ax.set_title("Круговая диаграмма")
                 else:
                     ax.text(0.5, 0.5, "Отсутствуют нужные данные", ha='center')
@@ -189,24 +844,26 @@ class DataAnalysisApp(QMainWindow):
         Добавляет новую строку данных, введенную вручную.
         """
         new_value = self.value_input.text()  # Получаем данные из поля ввода
-        if self.data is not None and new_value:  # Проверяем, что данные существуют и ввод не пуст
+        if (self.data is not None or self.store is not None) and new_value:  # Проверяем, что данные существуют и ввод не пуст
             try:
+                columns = self.store.columns if self.store is not None else self.data.columns
                 new_values = new_value.split(',')  # Разделяем данные по запятой
-                if len(new_values) != len(self.data.columns):  # Проверяем, что количество данных совпадает с столбцами
+                if len(new_values) != len(columns):  # Проверяем, что количество данных совпадает с столбцами
                     raise ValueError("Число введённых значений не соответствует числу столбцов!")
 
                 # Создаем новую строку как DataFrame
-                new_row = pd.DataFrame([new_values], columns=self.data.columns)
+                new_row = pd.DataFrame([new_values], columns=columns)
 
                 # Преобразуем числовые столбцы
-                numeric_columns = ['Value1', 'Value2']  # Преобразуем числовые столбцы
-                numeric_columns = ['Value1', 'Value2']  # Определяем числовые столбцы
-                for column in numeric_columns:
+                for column in NUMERIC_COLUMNS:
                     if column in new_row.columns:  # Проверяем, что столбец существует в новой строке
                         new_row[column] = pd.to_numeric(new_row[column], errors='coerce')  # Преобразуем данные в числа
 
-                # Добавляем новую строку в основной DataFrame
-                self.data = pd.concat([self.data, new_row], ignore_index=True)  # Добавляем строку в конец данных
+                if self.store is not None:
+                    self.store.append(new_row)  # В режиме больших файлов строка записывается в таблицу сеанса
+                else:
+                    # Добавляем новую строку в основной DataFrame
+                    self.data = pd.concat([self.data, new_row], ignore_index=True)  # Добавляем строку в конец данных
 
                 # Обновляем интерфейс после добавления данных
                 self.update_stats()  # Обновляем статистику
@@ -216,6 +873,62 @@ class DataAnalysisApp(QMainWindow):
                 # Если возникает ошибка, выводим её в поле статистики
                 self.stats_label.setText(f"Ошибка: {e}")
 
+    def export_data(self):
+        """
+        Экспортирует текущие данные в файл выбранного формата в фоновом потоке.
+        """
+        if self.data is None and self.store is None:
+            self.stats_label.setText("Нет данных для экспорта.")
+            return
+
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self, "Сохранить данные", "", ";;".join(EXPORT_FORMATS)
+        )
+        if not file_path:  # Пользователь отменил сохранение
+            return
+
+        export_format, extension = export_format_for(file_path, selected_filter)
+        if not file_path.lower().endswith(extension):
+            file_path += extension
+
+        if self.store is not None:
+            # Порции читаются с диска в фоновом потоке через отдельное соединение
+            chunks, total, dtypes = self.store.iter_chunks(), self.store.rows, self.store.dtypes
+        else:
+            # Генератор держит ссылку на текущий DataFrame: загрузка и добавление строк создают новый объект
+            data = self.data
+            total, dtypes = len(data), dict(data.dtypes)
+            chunks = (data.iloc[start:start + EXPORT_CHUNK_SIZE] for start in range(0, total, EXPORT_CHUNK_SIZE))
+
+        self.export_button.setEnabled(False)  # Не допускаем параллельный экспорт
+        self.update_task_buttons()
+        self.export_progress_bar.setValue(0)
+        threading.Thread(
+            target=self.export_chunks, args=(file_path, export_format, chunks, total, dtypes), daemon=True
+        ).start()
+
+    def export_chunks(self, file_path, export_format, chunks, total, dtypes):
+        """
+        Записывает порции данных в файл (выполняется в фоновом потоке).
+        """
+        try:
+            exported = 0
+            for rows in EXPORT_WRITERS[export_format](file_path, chunks, dtypes):
+                exported += rows
+                self.task_signals.export_progress_updated.emit(int(exported / total * 100) if total else 100)
+            self.task_signals.export_finished.emit(f"Экспортировано строк: {exported} в {file_path}")
+        except Exception as e:
+            self.task_signals.export_finished.emit(f"Ошибка при экспорте данных: {e}")
+
+    def on_export_finished(self, message):
+        """
+        Отображает результат экспорта и разблокирует кнопки.
+        """
+        self.export_button.setEnabled(True)
+        self.update_task_buttons()
+        self.export_progress_bar.setValue(100)
+        self.stats_label.setText(message)
+
 
 if __name__ == "__main__":
     # Создаем приложение